@@ -1,4 +1,10 @@
 from __future__ import annotations
+import multiprocessing
+import warnings
+from itertools import chain
+from itertools import repeat
+from typing import Iterator
+from typing import Optional
 import numpy
 from deprecated.sphinx import deprecated
 from matchms.similarity.BaseSimilarity import BaseSimilarity
@@ -52,6 +58,9 @@ class Scores:
         Cosine score between spectrum2 and spectrum3 is 0.14 with 1 matched peaks
         Cosine score between spectrum2 and spectrum4 is 0.61 with 1 matched peaks
     """
+    __slots__ = ("n_rows", "n_cols", "references", "queries", "similarity_function",
+                 "is_symmetric", "_scores", "_iterator")
+
     def __init__(self, references: ReferencesType, queries: QueriesType,
                  similarity_function: BaseSimilarity, is_symmetric: bool = False):
         """
@@ -76,33 +85,48 @@ class Scores:
 
         self.n_rows = len(references)
         self.n_cols = len(queries)
-        self.references = numpy.asarray(references)
-        self.queries = numpy.asarray(queries)
+        self.references = tuple(references)
+        self.queries = tuple(queries)
         self.similarity_function = similarity_function
         self.is_symmetric = is_symmetric
-        self._scores = numpy.empty([self.n_rows, self.n_cols], dtype="object")
-        self._index = 0
+        # Score matrix is only allocated once scores are calculated
+        self._scores = None
+        self._iterator = None
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if self._index < self.scores.size:
-            # pylint: disable=unbalanced-tuple-unpacking
-            r, c = numpy.unravel_index(self._index, self._scores.shape)
-            self._index += 1
-            result = self._scores[r, c]
-            if not isinstance(result, tuple):
-                result = (result,)
-            return (self.references[r], self.queries[c]) + result
-        self._index = 0
-        raise StopIteration
+        if self._iterator is None:
+            assert self._scores is not None, "Scores have not been calculated yet. Use calculate_scores() first."
+            # Lazily pair every reference with all queries and the flattened (row-major) scores
+            references = chain.from_iterable(repeat(reference, self.n_cols) for reference in self.references)
+            queries = chain.from_iterable(repeat(self.queries, self.n_rows))
+            self._iterator = zip(references, queries, self._scores.flat)
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            self._iterator = None
+            raise
+
+    def __getstate__(self):
+        # The lazily built iterator cannot be pickled, an unpickled Scores starts iterating from the beginning
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["_iterator"] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
 
     def __str__(self):
+        if self._scores is None:
+            return f"<Scores {self.n_rows} x {self.n_cols}, not calculated>"
         return self._scores.__str__()
 
     @staticmethod
-    def _validate_input_arguments(references, queries, similarity_function):
+    def _validate_input_arguments(references: ReferencesType, queries: QueriesType,
+                                  similarity_function: BaseSimilarity):
         assert isinstance(references, (list, tuple, numpy.ndarray)),\
             "Expected input argument 'references' to be list or tuple or numpy.ndarray."
 
@@ -113,21 +137,139 @@ class Scores:
             "Expected input argument 'similarity_function' to have BaseSimilarity as super-class."
 
     @deprecated(version='0.6.0', reason="Calculate scores via calculate_scores() function.")
-    def calculate(self) -> Scores:
+    def calculate(self, block_size: Optional[int] = None,
+                  n_processes: Optional[int] = None) -> Scores:
         """
         Calculate the similarity between all reference objects v all query objects using
         the most suitable available implementation of the given similarity_function.
         Advised method to calculate similarity scores is :meth:`~matchms.calculate_scores`.
+
+        Parameters
+        ----------
+        block_size
+            If given, scores are computed in blocks of at most block_size x block_size
+            references and queries which are written directly into the score matrix.
+            This keeps intermediate arrays of the similarity function small. Ignored (with a
+            warning) for similarity functions which do not support blocks. Default is None,
+            which computes all scores in one go.
+        n_processes
+            If given, the references are split into n_processes chunks of rows which are
+            computed in parallel worker processes. This is mostly useful for expensive similarity
+            functions written in pure Python. Requires the similarity function, references and
+            queries to be picklable. Cannot be combined with block_size. Ignored (with a warning)
+            for similarity functions which do not support blocks. Default is None.
         """
-        if self.n_rows == self.n_cols == 1:
-            self._scores[0, 0] = self.similarity_function.pair(self.references[0],
-                                                               self.queries[0])
+        assert block_size is None or n_processes is None, \
+            "Expected only one of 'block_size' and 'n_processes' to be given."
+        self._iterator = None
+        if not self.similarity_function.supports_blocks and (block_size is not None or n_processes is not None):
+            warnings.warn(f"{type(self.similarity_function).__name__} does not support computing scores in parts, "
+                          "ignoring 'block_size' and 'n_processes'.")
+            block_size = n_processes = None
+        if block_size is not None:
+            self._scores = self._calculate_blockwise(block_size)
+        elif n_processes is not None:
+            self._scores = self._calculate_multiprocess(n_processes)
         else:
             self._scores = self.similarity_function.matrix(self.references,
                                                            self.queries,
                                                            is_symmetric=self.is_symmetric)
         return self
 
+    def _calculate_blockwise(self, block_size: int) -> numpy.ndarray:
+        assert block_size > 0, "Expected block_size to be a positive integer."
+        scores = numpy.empty([self.n_rows, self.n_cols],
+                             dtype=self.similarity_function.score_datatype)
+        symmetric = self.is_symmetric and self.similarity_function.is_commutative
+        for row_start in range(0, self.n_rows, block_size):
+            rows = slice(row_start, row_start + block_size)
+            # For symmetric scores only blocks on and above the diagonal are computed
+            for col_start in range(row_start if symmetric else 0, self.n_cols, block_size):
+                cols = slice(col_start, col_start + block_size)
+                scores[rows, cols] = self.similarity_function.matrix(
+                    self.references[rows], self.queries[cols],
+                    is_symmetric=symmetric and row_start == col_start)
+                if symmetric and row_start != col_start:
+                    scores[cols, rows] = scores[rows, cols].T
+        return scores
+
+    def _calculate_multiprocess(self, n_processes: int) -> numpy.ndarray:
+        assert n_processes > 0, "Expected n_processes to be a positive integer."
+        scores = numpy.empty([self.n_rows, self.n_cols],
+                             dtype=self.similarity_function.score_datatype)
+        symmetric = self.is_symmetric and self.similarity_function.is_commutative
+        # One chunk of rows per process, so that queries are only pickled once per process
+        row_chunks = [chunk for chunk in numpy.array_split(numpy.arange(self.n_rows), n_processes)
+                      if chunk.size > 0]
+        tasks = []
+        for chunk in row_chunks:
+            # For symmetric scores only columns on and right of the diagonal are needed
+            col_start = chunk[0] if symmetric else 0
+            tasks.append((self.similarity_function,
+                          self.references[chunk[0]:chunk[-1] + 1],
+                          self.queries[col_start:]))
+        with multiprocessing.Pool(len(row_chunks)) as pool:
+            results = pool.starmap(_calculate_rows, tasks)
+        for chunk, chunk_scores in zip(row_chunks, results):
+            col_start = chunk[0] if symmetric else 0
+            scores[chunk[0]:chunk[-1] + 1, col_start:] = chunk_scores
+        if symmetric:
+            # Mirror upper triangle onto lower triangle
+            lower_triangle = numpy.tril_indices(self.n_rows, k=-1, m=self.n_cols)
+            scores[lower_triangle] = scores.T[lower_triangle]
+        return scores
+
+    def iter_above(self, threshold: float) -> Iterator[tuple]:
+        """Iterate over all reference, query, score combinations with a score >= threshold.
+
+        The threshold is applied to all scores at once, which is much faster than iterating
+        over all scores when only few of them are of interest. For scores with multiple
+        fields (e.g. "score" and "matches"), the "score" field (or otherwise the first field)
+        is compared to the threshold.
+
+        For example
+
+        .. testcode::
+
+            import numpy as np
+            from matchms import calculate_scores, Spectrum
+            from matchms.similarity import CosineGreedy
+
+            spectrum_1 = Spectrum(mz=np.array([100, 150, 200.]),
+                                  intensities=np.array([0.7, 0.2, 0.1]),
+                                  metadata={'id': 'spectrum1'})
+            spectrum_2 = Spectrum(mz=np.array([100, 140, 190.]),
+                                  intensities=np.array([0.4, 0.2, 0.1]),
+                                  metadata={'id': 'spectrum2'})
+            spectrums = [spectrum_1, spectrum_2]
+
+            scores = calculate_scores(spectrums, spectrums, CosineGreedy())
+
+            for (reference, query, score) in scores.iter_above(0.9):
+                print(f"Cosine score between {reference.get('id')} and {query.get('id')}" +
+                      f" is {score['score']:.2f}")
+
+        Should output
+
+        .. testoutput::
+
+            Cosine score between spectrum1 and spectrum1 is 1.00
+            Cosine score between spectrum2 and spectrum2 is 1.00
+
+        Parameters
+        ----------
+        threshold
+            Only combinations with a score of at least threshold will be returned.
+        """
+        assert self._scores is not None, "Scores have not been calculated yet. Use calculate_scores() first."
+        names = self._scores.dtype.names
+        if names is None:
+            selected_scores = self._scores
+        else:
+            selected_scores = self._scores["score" if "score" in names else names[0]]
+        for r, c in numpy.argwhere(selected_scores >= threshold):
+            yield self.references[r], self.queries[c], self._scores[r, c]
+
     def scores_by_reference(self, reference: ReferencesType,
                             sort: bool = False) -> numpy.ndarray:
         """Return all scores for the given reference spectrum.
@@ -140,11 +282,12 @@ class Scores:
             Set to True to obtain the scores in a sorted way (relying on the
             :meth:`~.BaseSimilarity.sort` function from the given similarity_function).
         """
+        assert self._scores is not None, "Scores have not been calculated yet. Use calculate_scores() first."
         assert reference in self.references, "Given input not found in references."
-        selected_idx = int(numpy.where(self.references == reference)[0])
+        selected_idx = self.references.index(reference)
         if sort:
             query_idx_sorted = self.similarity_function.sort(self._scores[selected_idx, :])
-            return list(zip(self.queries[query_idx_sorted],
+            return list(zip([self.queries[i] for i in query_idx_sorted],
                             self._scores[selected_idx, query_idx_sorted].copy()))
         return list(zip(self.queries, self._scores[selected_idx, :].copy()))
 
@@ -193,17 +336,19 @@ class Scores:
             :meth:`~.BaseSimilarity.sort` function from the given similarity_function).
 
         """
+        assert self._scores is not None, "Scores have not been calculated yet. Use calculate_scores() first."
         assert query in self.queries, "Given input not found in queries."
-        selected_idx = int(numpy.where(self.queries == query)[0])
+        selected_idx = self.queries.index(query)
         if sort:
             references_idx_sorted = self.similarity_function.sort(self._scores[:, selected_idx])
-            return list(zip(self.references[references_idx_sorted],
+            return list(zip([self.references[i] for i in references_idx_sorted],
                             self._scores[references_idx_sorted, selected_idx].copy()))
         return list(zip(self.references, self._scores[:, selected_idx].copy()))
 
     @property
     def scores(self) -> numpy.ndarray:
-        """Scores as numpy array
+        """Scores as read-only numpy array. Use ``scores.scores.copy()`` to obtain an
+        array that can be modified.
 
         For example
 
@@ -234,4 +379,13 @@ class Scores:
              [[1.  0.2]
               [0.2 1. ]]
         """
-        return self._scores.copy()
+        assert self._scores is not None, "Scores have not been calculated yet. Use calculate_scores() first."
+        scores = self._scores.view()
+        scores.setflags(write=False)
+        return scores
+
+
+def _calculate_rows(similarity_function: BaseSimilarity, references: ReferencesType,
+                    queries: QueriesType) -> numpy.ndarray:
+    """Compute scores for a chunk of references (run in a worker process)."""
+    return similarity_function.matrix(references, queries)
@@ -1,3 +1,4 @@
+from typing import Optional
 from .Scores import Scores
 from .similarity.BaseSimilarity import BaseSimilarity
 from .typing import QueriesType
@@ -6,7 +7,9 @@ from .typing import ReferencesType
 
 def calculate_scores(references: ReferencesType, queries: QueriesType,
                      similarity_function: BaseSimilarity,
-                     is_symmetric: bool = False) -> Scores:
+                     is_symmetric: bool = False,
+                     block_size: Optional[int] = None,
+                     n_processes: Optional[int] = None) -> Scores:
     """Calculate the similarity between all reference objects versus all query objects.
 
     Example to calculate scores between 2 spectrums and iterate over the scores
@@ -52,13 +55,22 @@ def calculate_scores(references: ReferencesType, queries: QueriesType,
         Set to True when *references* and *queries* are identical (as for instance for an all-vs-all
         comparison). By using the fact that score[i,j] = score[j,i] the calculation will be about
         2x faster. Default is False.
+    block_size
+        If given, scores are computed in blocks of at most block_size x block_size
+        references and queries. This limits the size of intermediate arrays created by
+        the similarity function for large numbers of spectra. Default is None.
+    n_processes
+        If given, scores are computed in parallel in n_processes worker processes, each
+        handling a chunk of the references. This is mostly useful for expensive similarity
+        functions written in pure Python. Cannot be combined with block_size. Default is None.
 
     Returns
     -------
 
     ~matchms.Scores.Scores
     """
-
-    return Scores(references=references, queries=queries,
-                  similarity_function=similarity_function,
-                  is_symmetric=is_symmetric).calculate()
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    scores = Scores(references=references, queries=queries,
+                    similarity_function=similarity_function,
+                    is_symmetric=is_symmetric)
+    return scores.calculate(block_size=block_size, n_processes=n_processes)
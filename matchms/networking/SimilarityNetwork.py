@@ -113,7 +113,7 @@ class SimilarityNetwork:
             generating a network.
         """
         assert self.top_n >= self.max_links, "top_n must be >= max_links"
-        assert numpy.all(scores.queries == scores.references), \
+        assert scores.queries == scores.references, \
             "Expected symmetric scores object with queries==references"
         unique_ids = list({s.get(self.identifier_key) for s in scores.queries})
 
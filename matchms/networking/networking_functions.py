@@ -34,23 +34,26 @@ def get_top_hits(scores: Scores, identifier_key: str = "spectrumid",
 
     similars_idx = dict()
     similars_scores = dict()
+    # Retrieve score matrix and sort method only once instead of for every spectrum
+    scores_matrix = scores.scores
+    sort = scores.similarity_function.sort
 
     if search_by == "queries":
         for i, spec in enumerate(scores.queries):
             spec_id = spec.get(identifier_key)
-            idx = scores.similarity_function.sort(scores.scores[:, i])
+            idx = sort(scores_matrix[:, i])
             if ignore_diagonal:
                 similars_idx[spec_id] = idx[idx != i][:top_n]
             else:
                 similars_idx[spec_id] = idx[:top_n]
-            similars_scores[spec_id] = scores.scores[similars_idx[spec_id], i]
+            similars_scores[spec_id] = scores_matrix[similars_idx[spec_id], i]
     elif search_by == "references":
         for i, spec in enumerate(scores.references):
             spec_id = spec.get(identifier_key)
-            idx = scores.similarity_function.sort(scores.scores[i, :])
+            idx = sort(scores_matrix[i, :])
             if ignore_diagonal:
                 similars_idx[spec_id] = idx[idx != i][:top_n]
             else:
                 similars_idx[spec_id] = idx[:top_n]
-            similars_scores[spec_id] = scores.scores[i, similars_idx[spec_id]]
+            similars_scores[spec_id] = scores_matrix[i, similars_idx[spec_id]]
     return similars_idx, similars_scores
@@ -14,9 +14,15 @@ class BaseSimilarity:
     is_commutative
        Whether similarity function is commutative, which means that the order of spectrums
        does not matter (similarity(A, B) == similarity(B, A)). Default is True.
+    supports_blocks
+       Whether *.matrix()* gives the same scores when called on parts of the references
+       and queries as when called on all of them. If False, scores are always computed
+       in a single *.matrix()* call, even when a block_size or n_processes is given.
+       Default is True.
     """
     # Set key characteristics as class attributes
     is_commutative = True
+    supports_blocks = True
     # Set output data type, e.g. "float" or [("score", "float"), ("matches", "int")]
     score_datatype = numpy.float64
 
@@ -54,17 +60,24 @@ class BaseSimilarity:
             comparison). By using the fact that score[i,j] = score[j,i] the calculation will be about
             2x faster.
         """
+        return self._matrix_from_pair(self.pair, references, queries, is_symmetric)
+
+    def _matrix_from_pair(self, pair, references: list, queries: list,
+                          is_symmetric: bool = False) -> numpy.ndarray:
+        """Fill matrix of scores by calling pair(reference, query) for all combinations
+        of references and queries."""
         n_rows = len(references)
         n_cols = len(queries)
         scores = numpy.empty([n_rows, n_cols], dtype=self.score_datatype)
-        for i_ref, reference in enumerate(references[:n_rows]):
-            if is_symmetric and self.is_commutative:
-                for i_query, query in enumerate(queries[i_ref:n_cols], start=i_ref):
-                    scores[i_ref][i_query] = self.pair(reference, query)
-                    scores[i_query][i_ref] = scores[i_ref][i_query]
-            else:
-                for i_query, query in enumerate(queries[:n_cols]):
-                    scores[i_ref][i_query] = self.pair(reference, query)
+        symmetric = is_symmetric and self.is_commutative
+
+        for i_ref, reference in enumerate(references):
+            for i_query in range(i_ref if symmetric else 0, n_cols):
+                scores[i_ref, i_query] = pair(reference, queries[i_query])
+        if symmetric:
+            # Mirror upper triangle onto lower triangle
+            lower_triangle = numpy.tril_indices(n_rows, k=-1, m=n_cols)
+            scores[lower_triangle] = scores.T[lower_triangle]
         return scores
 
     def sort(self, scores: numpy.ndarray):
@@ -1,4 +1,6 @@
+from typing import List
 from typing import Tuple
+import numba
 import numpy
 from matchms.typing import SpectrumType
 from .BaseSimilarity import BaseSimilarity
@@ -83,21 +85,64 @@ class CosineGreedy(BaseSimilarity):
         Score
             Tuple with cosine score and number of matched peaks.
         """
-        def get_matching_pairs():
-            """Get pairs of peaks that match within the given tolerance."""
-            matching_pairs = collect_peak_pairs(spec1, spec2, self.tolerance,
-                                                shift=0.0, mz_power=self.mz_power,
-                                                intensity_power=self.intensity_power)
-            if matching_pairs is None:
-                return None
-            matching_pairs = matching_pairs[numpy.argsort(matching_pairs[:, 2])[::-1], :]
-            return matching_pairs
-
-        spec1 = reference.peaks.to_numpy
-        spec2 = query.peaks.to_numpy
-        matching_pairs = get_matching_pairs()
-        if matching_pairs is None:
-            return numpy.asarray((float(0), 0), dtype=self.score_datatype)
-        score = score_best_matches(matching_pairs, spec1, spec2,
-                                   self.mz_power, self.intensity_power)
+        score = cosine_greedy_pair(reference.peaks.to_numpy, query.peaks.to_numpy,
+                                   self.tolerance, self.mz_power, self.intensity_power)
         return numpy.asarray(score, dtype=self.score_datatype)
+
+    def matrix(self, references: List[SpectrumType], queries: List[SpectrumType],
+               is_symmetric: bool = False) -> numpy.ndarray:
+        """Calculate matrix of cosine scores between all references and queries.
+
+        Parameters
+        ----------
+        references
+            List of reference spectrums.
+        queries
+            List of query spectrums.
+        is_symmetric
+            Set to True when *references* and *queries* are identical (as for instance for an all-vs-all
+            comparison). By using the fact that score[i,j] = score[j,i] the calculation will be about
+            2x faster.
+        """
+        def collect_peaks(spectrums):
+            """Collect peaks of all spectrums as typed list of (contiguous) arrays."""
+            peaks = numba.typed.List()
+            for spectrum in spectrums:
+                peaks.append(numpy.ascontiguousarray(spectrum.peaks.to_numpy))
+            return peaks
+
+        scores = numpy.zeros((len(references), len(queries)), dtype=self.score_datatype)
+        if scores.size == 0:
+            return scores
+        peaks_references = collect_peaks(references)
+        peaks_queries = peaks_references if is_symmetric else collect_peaks(queries)
+        scores["score"], scores["matches"] = cosine_greedy_scores(peaks_references, peaks_queries,
+                                                                  self.tolerance, self.mz_power,
+                                                                  self.intensity_power, is_symmetric)
+        return scores
+
+
+@numba.njit(nogil=True)
+def cosine_greedy_pair(spec1, spec2, tolerance, mz_power, intensity_power):
+    matching_pairs = collect_peak_pairs(spec1, spec2, tolerance, shift=0.0,
+                                        mz_power=mz_power, intensity_power=intensity_power)
+    if matching_pairs is None:
+        return 0.0, 0
+    matching_pairs = matching_pairs[numpy.argsort(matching_pairs[:, 2], kind="mergesort")[::-1], :]
+    return score_best_matches(matching_pairs, spec1, spec2, mz_power, intensity_power)
+
+
+@numba.njit(nogil=True)
+def cosine_greedy_scores(peaks_references, peaks_queries, tolerance, mz_power, intensity_power,
+                         is_symmetric):
+    # pylint: disable=too-many-arguments
+    scores = numpy.zeros((len(peaks_references), len(peaks_queries)))
+    matches = numpy.zeros((len(peaks_references), len(peaks_queries)), dtype=numpy.int64)
+    for i, spec1 in enumerate(peaks_references):
+        for j in range(i if is_symmetric else 0, len(peaks_queries)):
+            scores[i, j], matches[i, j] = cosine_greedy_pair(spec1, peaks_queries[j], tolerance,
+                                                             mz_power, intensity_power)
+            if is_symmetric:
+                scores[j, i] = scores[i, j]
+                matches[j, i] = matches[i, j]
+    return scores, matches
@@ -59,6 +59,8 @@ class FingerprintSimilarity(BaseSimilarity):
     """
     # Set key characteristics as class attributes
     is_commutative = True
+    # matrix() requires fingerprints among all references and queries, not per block
+    supports_blocks = False
     # Set output data type, e.g.  "float" or [("score", "float"), ("matches", "int")]
     score_datatype = numpy.float64
 
@@ -114,6 +116,10 @@ class FingerprintSimilarity(BaseSimilarity):
             List of reference spectrums.
         queries:
             List of query spectrums.
+        is_symmetric:
+            Set to True when *references* and *queries* are identical (as for instance for an all-vs-all
+            comparison). By using the fact that score[i,j] = score[j,i] the calculation will be about
+            2x faster.
         """
         def get_fingerprints(spectrums):
             for index, spectrum in enumerate(spectrums):
@@ -139,7 +145,10 @@ class FingerprintSimilarity(BaseSimilarity):
             return similarity_matrix
 
         fingerprints1, idx_fingerprints1 = collect_fingerprints(references)
-        fingerprints2, idx_fingerprints2 = collect_fingerprints(queries)
+        if is_symmetric:
+            fingerprints2, idx_fingerprints2 = fingerprints1, idx_fingerprints1
+        else:
+            fingerprints2, idx_fingerprints2 = collect_fingerprints(queries)
         assert idx_fingerprints1.size > 0 and idx_fingerprints2.size > 0, ("Not enouth molecular fingerprints.",
                                                                            "Apply 'add_fingerprint'filter first.")
 
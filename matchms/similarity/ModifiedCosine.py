@@ -1,3 +1,4 @@
+from typing import List
 from typing import Tuple
 import numpy
 from matchms.typing import SpectrumType
@@ -84,21 +85,54 @@ class ModifiedCosine(BaseSimilarity):
 
         Tuple with cosine score and number of matched peaks.
         """
+        return self._pair_peaks(self._get_peaks_and_precursor_mz(reference),
+                                self._get_peaks_and_precursor_mz(query))
+
+    def matrix(self, references: List[SpectrumType], queries: List[SpectrumType],
+               is_symmetric: bool = False) -> numpy.ndarray:
+        """Calculate matrix of modified cosine scores between all references and queries.
+
+        Parameters
+        ----------
+        references
+            List of reference spectrums.
+        queries
+            List of query spectrums.
+        is_symmetric
+            Set to True when *references* and *queries* are identical (as for instance for an all-vs-all
+            comparison). By using the fact that score[i,j] = score[j,i] the calculation will be about
+            2x faster.
+        """
+        # Collect peaks and precursor m/z only once per spectrum instead of once per pair
+        peaks_references = [self._get_peaks_and_precursor_mz(reference) for reference in references]
+        if is_symmetric:
+            peaks_queries = peaks_references
+        else:
+            peaks_queries = [self._get_peaks_and_precursor_mz(query) for query in queries]
+        return self._matrix_from_pair(self._pair_peaks, peaks_references, peaks_queries,
+                                      is_symmetric)
+
+    @staticmethod
+    def _get_peaks_and_precursor_mz(spectrum: SpectrumType) -> Tuple[numpy.ndarray, float]:
+        precursor_mz = spectrum.get("precursor_mz")
+        message_precursor_missing = \
+            "Precursor_mz missing. Apply 'add_precursor_mz' filter first."
+        assert precursor_mz, message_precursor_missing
+        message_precursor_below_0 = "Expect precursor to be positive number." \
+                                    "Apply 'require_precursor_mz' first"
+        assert precursor_mz > 0, message_precursor_below_0
+        return spectrum.peaks.to_numpy, precursor_mz
+
+    def _pair_peaks(self, reference: Tuple[numpy.ndarray, float],
+                    query: Tuple[numpy.ndarray, float]) -> numpy.ndarray:
+        """Calculate modified cosine score between two spectra given as peak arrays
+        and precursor m/z."""
         def get_matching_pairs():
             """Find all pairs of peaks that match within the given tolerance."""
             zero_pairs = collect_peak_pairs(spec1, spec2, self.tolerance, shift=0.0,
                                             mz_power=self.mz_power,
                                             intensity_power=self.intensity_power)
-            message_precursor_missing = \
-                "Precursor_mz missing. Apply 'add_precursor_mz' filter first."
-            assert reference.get("precursor_mz") \
-                   and query.get("precursor_mz"), message_precursor_missing
-            message_precursor_below_0 = "Expect precursor to be positive number." \
-                                        "Apply 'require_precursor_mz' first"
-            assert reference.get("precursor_mz") > 0 \
-                   and query.get("precursor_mz") > 0, message_precursor_below_0
-
-            mass_shift = reference.get("precursor_mz") - query.get("precursor_mz")
+            mass_shift = precursor_mz1 - precursor_mz2
             nonzero_pairs = collect_peak_pairs(spec1, spec2, self.tolerance, shift=mass_shift,
                                                mz_power=self.mz_power,
                                                intensity_power=self.intensity_power)
@@ -112,8 +146,8 @@ class ModifiedCosine(BaseSimilarity):
                 matching_pairs = matching_pairs[numpy.argsort(matching_pairs[:, 2])[::-1], :]
             return matching_pairs
 
-        spec1 = reference.peaks.to_numpy
-        spec2 = query.peaks.to_numpy
+        spec1, precursor_mz1 = reference
+        spec2, precursor_mz2 = query
         matching_pairs = get_matching_pairs()
         if matching_pairs.shape[0] == 0:
             return numpy.asarray((float(0), 0), dtype=self.score_datatype)
@@ -4,7 +4,7 @@ import numba
 import numpy
 
 
-@numba.njit
+@numba.njit(nogil=True)
 def collect_peak_pairs(spec1: numpy.ndarray, spec2: numpy.ndarray,
                        tolerance: float, shift: float = 0, mz_power: float = 0.0,
                        intensity_power: float = 1.0):
@@ -45,7 +45,7 @@ def collect_peak_pairs(spec1: numpy.ndarray, spec2: numpy.ndarray,
     return numpy.array(matching_pairs.copy())
 
 
-@numba.njit
+@numba.njit(nogil=True)
 def find_matches(spec1_mz: numpy.ndarray, spec2_mz: numpy.ndarray,
                  tolerance: float, shift: float = 0) -> List[Tuple[int, int]]:
     """Faster search for matching peaks.
@@ -86,7 +86,7 @@ def find_matches(spec1_mz: numpy.ndarray, spec2_mz: numpy.ndarray,
     return matches
 
 
-@numba.njit(fastmath=True)
+@numba.njit(fastmath=True, nogil=True)
 def score_best_matches(matching_pairs: numpy.ndarray, spec1: numpy.ndarray,
                        spec2: numpy.ndarray, mz_power: float = 0.0,
                        intensity_power: float = 1.0) -> Tuple[float, int]:
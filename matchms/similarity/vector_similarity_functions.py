@@ -23,13 +23,14 @@ def jaccard_similarity_matrix(references: numpy.ndarray, queries: numpy.ndarray)
         Matrix of all-vs-all similarity scores. scores[i, j] will contain the score
         between the vectors references[i, :] and queries[j, :].
     """
-    size1 = references.shape[0]
-    size2 = queries.shape[0]
-    scores = numpy.zeros((size1, size2))
-    for i in range(size1):
-        for j in range(size2):
-            scores[i, j] = jaccard_index(references[i, :], queries[j, :])
-    return scores
+    # Count shared and total non-zero entries of all vector pairs with one matrix product
+    references_bool = (references != 0).astype(numpy.float64)
+    queries_bool = (queries != 0).astype(numpy.float64)
+    intersections = references_bool @ numpy.ascontiguousarray(queries_bool.T)
+    unions = references_bool.sum(axis=1).reshape(-1, 1) \
+        + queries_bool.sum(axis=1).reshape(1, -1) - intersections
+    # Pairs of vectors with all zeros get score 0 (instead of division by 0)
+    return intersections / numpy.where(unions == 0, 1.0, unions)
 
 
 @numba.njit
@@ -52,13 +53,14 @@ def dice_similarity_matrix(references: numpy.ndarray, queries: numpy.ndarray) ->
         Matrix of all-vs-all similarity scores. scores[i, j] will contain the score
         between the vectors references[i, :] and queries[j, :].
     """
-    size1 = references.shape[0]
-    size2 = queries.shape[0]
-    scores = numpy.zeros((size1, size2))
-    for i in range(size1):
-        for j in range(size2):
-            scores[i, j] = dice_similarity(references[i, :], queries[j, :])
-    return scores
+    # Count shared non-zero entries of all vector pairs with one matrix product
+    references_bool = (references != 0).astype(numpy.float64)
+    queries_bool = (queries != 0).astype(numpy.float64)
+    intersections = references_bool @ numpy.ascontiguousarray(queries_bool.T)
+    denominators = numpy.abs(references).sum(axis=1).reshape(-1, 1) \
+        + numpy.abs(queries).sum(axis=1).reshape(1, -1)
+    # Pairs of vectors with all zeros get score 0 (instead of division by 0)
+    return 2.0 * intersections / numpy.where(denominators == 0, 1.0, denominators)
 
 
 @numba.njit
@@ -81,13 +83,17 @@ def cosine_similarity_matrix(references: numpy.ndarray, queries: numpy.ndarray)
         Matrix of all-vs-all similarity scores. scores[i, j] will contain the score
         between the vectors references[i, :] and queries[j, :].
     """
-    size1 = references.shape[0]
-    size2 = queries.shape[0]
-    scores = numpy.zeros((size1, size2))
-    for i in range(size1):
-        for j in range(size2):
-            scores[i, j] = cosine_similarity(references[i, :], queries[j, :])
-    return scores
+    # Normalize all vectors once, then compute all scores as one matrix product
+    references_norm = references.astype(numpy.float64)
+    queries_norm = queries.astype(numpy.float64)
+    norms1 = numpy.sqrt((references_norm ** 2).sum(axis=1))
+    norms2 = numpy.sqrt((queries_norm ** 2).sum(axis=1))
+    # Vectors with all zeros get score 0 (instead of division by 0)
+    norms1[norms1 == 0] = 1.0
+    norms2[norms2 == 0] = 1.0
+    references_norm = references_norm / norms1.reshape(-1, 1)
+    queries_norm = queries_norm / norms2.reshape(-1, 1)
+    return references_norm @ numpy.ascontiguousarray(queries_norm.T)
 
 
 @numba.njit
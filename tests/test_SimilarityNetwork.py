@@ -160,9 +160,9 @@ def test_create_network_symmetric_mutual_method():
     cutoff = 0.7
     scores = create_dummy_scores_symmetric()
     # change some scores
-    scores.scores[7, 6] = scores.scores[6, 7] = 0.85
-    scores.scores[7, 5] = scores.scores[5, 7] = 0.75
-    scores.scores[7, 3] = scores.scores[3, 7] = 0.7
+    scores._scores[7, 6] = scores._scores[6, 7] = 0.85
+    scores._scores[7, 5] = scores._scores[5, 7] = 0.75
+    scores._scores[7, 3] = scores._scores[3, 7] = 0.7
 
     msnet = SimilarityNetwork(score_cutoff=cutoff, top_n=3,
                               max_links=3, link_method="mutual")
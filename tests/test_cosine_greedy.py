@@ -150,3 +150,27 @@ def test_cosine_greedy_with_arrays_symmetric():
 
     assert scores[0][0][0] == pytest.approx(scores[1][1][0], 0.000001), "Expected different cosine score."
     assert scores[0][1][0] == pytest.approx(scores[1][0][0], 0.000001), "Expected different cosine score."
+
+
+def test_cosine_greedy_matrix_same_as_pair():
+    """Test if matrix gives same scores as pair, including spectrums with 0 or 1 peaks."""
+    spectrum_1 = Spectrum(mz=numpy.array([100, 200, 300], dtype="float"),
+                          intensities=numpy.array([0.1, 0.2, 1.0], dtype="float"))
+    spectrum_2 = Spectrum(mz=numpy.array([100, 190, 300], dtype="float"),
+                          intensities=numpy.array([0.5, 0.2, 1.0], dtype="float"))
+    spectrum_3 = Spectrum(mz=numpy.array([200], dtype="float"),
+                          intensities=numpy.array([0.4], dtype="float"))
+    spectrum_4 = Spectrum(mz=numpy.array([], dtype="float"),
+                          intensities=numpy.array([], dtype="float"))
+    references = [spectrum_1, spectrum_2, spectrum_3]
+    queries = [spectrum_1, spectrum_3, spectrum_4]
+    cosine_greedy = CosineGreedy()
+    scores = cosine_greedy.matrix(references, queries)
+
+    assert scores.dtype == numpy.dtype(cosine_greedy.score_datatype), "Expected different dtype."
+    for i, reference in enumerate(references):
+        for j, query in enumerate(queries):
+            expected = cosine_greedy.pair(reference, query)
+            assert scores[i, j]["score"] == pytest.approx(expected["score"], nan_ok=True), \
+                "Expected different cosine score."
+            assert scores[i, j]["matches"] == expected["matches"], "Expected different number of matches."
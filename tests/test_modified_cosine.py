@@ -121,3 +121,40 @@ def test_modified_cosine_with_mass_shift_5_no_matches_expected():
 
     assert score["score"] == pytest.approx(0.0, 1e-5), "Expected different modified cosine score."
     assert score["matches"] == 0, "Expected 0 matching peaks."
+
+
+@pytest.mark.parametrize("is_symmetric", [False, True])
+def test_modified_cosine_with_arrays(is_symmetric):
+    """Test modified cosine matrix against scores computed for every pair."""
+    spectrum_1 = Spectrum(mz=numpy.array([100, 150, 200, 300, 500, 510, 1100], dtype="float"),
+                          intensities=numpy.array([700, 200, 100, 1000, 200, 5, 500], dtype="float"),
+                          metadata={"precursor_mz": 1000.0})
+    spectrum_2 = Spectrum(mz=numpy.array([55, 105, 205, 304.5, 494.5, 515.5, 1045], dtype="float"),
+                          intensities=numpy.array([700, 200, 100, 1000, 200, 5, 500], dtype="float"),
+                          metadata={"precursor_mz": 1005.0})
+    spectrum_3 = Spectrum(mz=numpy.array([100, 200, 300], dtype="float"),
+                          intensities=numpy.array([10, 10, 500], dtype="float"),
+                          metadata={"precursor_mz": 995.0})
+    spectrums = [normalize_intensities(s) for s in [spectrum_1, spectrum_2, spectrum_3]]
+    modified_cosine = ModifiedCosine(tolerance=1.0)
+    scores = modified_cosine.matrix(spectrums, spectrums, is_symmetric=is_symmetric)
+
+    for i, reference in enumerate(spectrums):
+        for j, query in enumerate(spectrums):
+            assert scores[i, j] == modified_cosine.pair(reference, query), "Expected different scores."
+
+
+def test_modified_cosine_matrix_without_precursor_mz():
+    """Test matrix without precursor-m/z. Should raise assertion error."""
+    spectrum_1 = Spectrum(mz=numpy.array([100, 150, 200.]),
+                          intensities=numpy.array([0.7, 0.2, 0.1]),
+                          metadata={"precursor_mz": 1000.0})
+    spectrum_2 = Spectrum(mz=numpy.array([100, 140, 190.]),
+                          intensities=numpy.array([0.4, 0.2, 0.1]))
+    modified_cosine = ModifiedCosine()
+
+    with pytest.raises(AssertionError) as msg:
+        modified_cosine.matrix([spectrum_1], [spectrum_1, spectrum_2])
+
+    expected_message = "Precursor_mz missing. Apply 'add_precursor_mz' filter first."
+    assert str(msg.value) == expected_message
@@ -1,9 +1,12 @@
+import pickle
+from unittest.mock import patch
 import numpy
 import pytest
 from matchms import Scores
 from matchms import Spectrum
 from matchms import calculate_scores
 from matchms.similarity import CosineGreedy
+from matchms.similarity import FingerprintSimilarity
 from matchms.similarity import IntersectMz
 from matchms.similarity.BaseSimilarity import BaseSimilarity
 
@@ -56,6 +59,21 @@ def test_scores_single_pair():
     assert actual == expected, "Expected different scores."
 
 
+def test_scores_single_pair_typed_matrix():
+    """Test that single pair scores are stored in a matrix of the score datatype."""
+    spectrum_1 = Spectrum(mz=numpy.array([100, 150, 200.]),
+                          intensities=numpy.array([0.7, 0.2, 0.1]))
+    spectrum_2 = Spectrum(mz=numpy.array([100, 140, 190.]),
+                          intensities=numpy.array([0.4, 0.2, 0.1]))
+    cosine_greedy = CosineGreedy()
+    scores = calculate_scores([spectrum_1], [spectrum_2], cosine_greedy)
+    assert scores.scores.dtype == numpy.dtype(cosine_greedy.score_datatype), "Expected different dtype."
+    reference, query, score = next(scores)
+    assert reference is spectrum_1 and query is spectrum_2, "Expected different spectrums."
+    assert score["score"] == pytest.approx(0.83, abs=0.01), "Expected different score."
+    assert score["matches"] == 1, "Expected different number of matches."
+
+
 def test_scores_calculate():
     dummy_similarity_function = DummySimilarityFunction()
     scores = Scores(references=["r0", "r1", "r2"],
@@ -92,13 +110,115 @@ def test_scores_calculate_parallel():
     assert actual == expected, "Expected different scores."
 
 
+@pytest.mark.parametrize("is_symmetric", [False, True])
+def test_scores_calculate_blockwise(is_symmetric):
+    """Test that calculating scores in blocks gives same scores."""
+    spectrums = [Spectrum(mz=numpy.array([100, 150, 200.]),
+                          intensities=numpy.array([0.7, 0.2, 0.1])),
+                 Spectrum(mz=numpy.array([100, 140, 190.]),
+                          intensities=numpy.array([0.4, 0.2, 0.1])),
+                 Spectrum(mz=numpy.array([110, 140, 195.]),
+                          intensities=numpy.array([0.6, 0.2, 0.1])),
+                 Spectrum(mz=numpy.array([100, 150, 200.]),
+                          intensities=numpy.array([0.6, 0.1, 0.6])),
+                 Spectrum(mz=numpy.array([100, 140, 195.]),
+                          intensities=numpy.array([0.6, 0.2, 0.1]))]
+    scores = calculate_scores(spectrums, spectrums, CosineGreedy(),
+                              is_symmetric=is_symmetric)
+    scores_blockwise = calculate_scores(spectrums, spectrums, CosineGreedy(),
+                                        is_symmetric=is_symmetric, block_size=2)
+    assert numpy.all(scores_blockwise.scores == scores.scores), "Expected different scores."
+
+
+def test_scores_calculate_blockwise_fingerprints_missing_in_first_block():
+    """Test that block_size gives same scores when the first block has no fingerprints."""
+    fingerprints = [None, None,
+                    numpy.array([1, 1, 0, 0, 1, 0]),
+                    numpy.array([0, 1, 1, 0, 1, 1])]
+    spectrums = [Spectrum(mz=numpy.array([100, 150, 200.]),
+                          intensities=numpy.array([0.7, 0.2, 0.1]),
+                          metadata={"fingerprint": fingerprint})
+                 for fingerprint in fingerprints]
+    scores = calculate_scores(spectrums, spectrums, FingerprintSimilarity())
+    with pytest.warns(UserWarning, match="ignoring 'block_size' and 'n_processes'"):
+        scores_blockwise = calculate_scores(spectrums, spectrums, FingerprintSimilarity(),
+                                            block_size=2)
+    assert numpy.array_equal(scores_blockwise.scores, scores.scores, equal_nan=True), \
+        "Expected different scores."
+
+
+def test_scores_calculate_multiprocess_fingerprints_missing_in_first_chunk():
+    """Test that n_processes gives same scores when the first chunk has no fingerprints."""
+    fingerprints = [None, None,
+                    numpy.array([1, 1, 0, 0, 1, 0]),
+                    numpy.array([0, 1, 1, 0, 1, 1])]
+    spectrums = [Spectrum(mz=numpy.array([100, 150, 200.]),
+                          intensities=numpy.array([0.7, 0.2, 0.1]),
+                          metadata={"fingerprint": fingerprint})
+                 for fingerprint in fingerprints]
+    scores = calculate_scores(spectrums, spectrums, FingerprintSimilarity())
+    with pytest.warns(UserWarning, match="ignoring 'block_size' and 'n_processes'"):
+        scores_multiprocess = calculate_scores(spectrums, spectrums, FingerprintSimilarity(),
+                                               n_processes=2)
+    assert numpy.array_equal(scores_multiprocess.scores, scores.scores, equal_nan=True), \
+        "Expected different scores."
+
+
+@pytest.mark.parametrize("is_symmetric", [False, True])
+def test_scores_calculate_multiprocess(is_symmetric):
+    """Test that calculating scores in worker processes gives same scores."""
+    spectrums = ["s0", "s1", "s2", "s3", "s4"]
+    scores = calculate_scores(spectrums, spectrums, DummySimilarityFunction(),
+                              is_symmetric=is_symmetric)
+    scores_multiprocess = calculate_scores(spectrums, spectrums, DummySimilarityFunction(),
+                                           is_symmetric=is_symmetric, n_processes=2)
+    assert numpy.all(scores_multiprocess.scores == scores.scores), "Expected different scores."
+
+
+def test_scores_calculate_blockwise_and_multiprocess():
+    """Test that block_size and n_processes cannot be combined."""
+    with pytest.raises(AssertionError) as msg:
+        calculate_scores(["r0", "r1"], ["q0", "q1"], DummySimilarityFunction(),
+                         block_size=1, n_processes=2)
+
+    assert str(msg.value) == "Expected only one of 'block_size' and 'n_processes' to be given."
+
+
+def test_scores_single_pair_uses_matrix():
+    """Test that single pair input is also computed via the matrix method."""
+    dummy_similarity_function = DummySimilarityFunctionParallel()
+    with patch.object(DummySimilarityFunctionParallel, "pair",
+                      side_effect=AssertionError("pair should not be called")):
+        scores = Scores(references=["A"],
+                        queries=["B"],
+                        similarity_function=dummy_similarity_function).calculate()
+    expected = numpy.array([('AB', 2)], dtype=dummy_similarity_function.score_datatype)
+    assert scores.scores[0][0] == expected, "Expected different scores."
+
+
+@pytest.mark.parametrize("references, queries", [(["r0"], ["q0", "q1", "q2"]),
+                                                 (["r0", "r1", "r2"], ["q0"])])
+def test_scores_single_row_or_column_uses_matrix(references, queries):
+    """Test that one-vs-many input is computed via the matrix method."""
+    dummy_similarity_function = DummySimilarityFunctionParallel()
+    with patch.object(DummySimilarityFunctionParallel, "pair",
+                      side_effect=AssertionError("pair should not be called")):
+        scores = Scores(references=references,
+                        queries=queries,
+                        similarity_function=dummy_similarity_function).calculate()
+    assert scores.scores.shape == (len(references), len(queries)), "Expected different scores shape."
+    actual = [(reference, query, score["score"]) for reference, query, score in scores]
+    expected = [(reference, query, reference + query) for reference in references for query in queries]
+    assert actual == expected, "Expected different scores."
+
+
 def test_scores_init_with_list():
 
     dummy_similarity_function = DummySimilarityFunction()
     scores = Scores(references=["r0", "r1", "r2"],
                     queries=["q0", "q1"],
                     similarity_function=dummy_similarity_function)
-    assert scores.scores.shape == (3, 2), "Expected different scores shape."
+    assert (scores.n_rows, scores.n_cols) == (3, 2), "Expected different scores shape."
 
 
 def test_scores_init_with_numpy_array():
@@ -107,7 +227,66 @@ def test_scores_init_with_numpy_array():
     scores = Scores(references=numpy.asarray(["r0", "r1", "r2"]),
                     queries=numpy.asarray(["q0", "q1"]),
                     similarity_function=dummy_similarity_function)
-    assert scores.scores.shape == (3, 2), "Expected different scores shape."
+    assert (scores.n_rows, scores.n_cols) == (3, 2), "Expected different scores shape."
+
+
+def test_scores_read_only():
+    """Test that scores property returns a read-only view on the scores."""
+    dummy_similarity_function = DummySimilarityFunction()
+    scores = Scores(references=["r0", "r1", "r2"],
+                    queries=["q0", "q1"],
+                    similarity_function=dummy_similarity_function).calculate()
+    with pytest.raises(ValueError):
+        scores.scores[0, 0] = ("r9q9", 4)
+    assert scores.scores[0, 0]["score"] == "r0q0", "Expected scores to be unchanged."
+
+
+def test_scores_init_with_sequence_objects():
+    """Test that references and queries which are sequences themselves are kept as they are."""
+    dummy_similarity_function = DummySimilarityFunction()
+    scores = Scores(references=[("r", "0"), ("r", "1"), ("r", "2")],
+                    queries=[("q", "0"), ("q", "1")],
+                    similarity_function=dummy_similarity_function)
+    assert len(scores.references) == 3, "Expected different number of references."
+    assert len(scores.queries) == 2, "Expected different number of queries."
+    assert scores.references[1] == ("r", "1"), "Expected references to be unchanged."
+
+
+def test_scores_before_calculate():
+    """Test that scores are only available after calculating them."""
+    dummy_similarity_function = DummySimilarityFunction()
+    scores = Scores(references=["r0", "r1", "r2"],
+                    queries=["q0", "q1"],
+                    similarity_function=dummy_similarity_function)
+    with pytest.raises(AssertionError) as msg:
+        scores.scores  # pylint: disable=pointless-statement
+
+    assert str(msg.value) == "Scores have not been calculated yet. Use calculate_scores() first."
+
+    with pytest.raises(AssertionError) as msg:
+        next(scores)
+
+    assert str(msg.value) == "Scores have not been calculated yet. Use calculate_scores() first."
+
+
+def test_scores_str_before_calculate():
+    """Test that printing scores before calculating them gives a short summary."""
+    scores = Scores(references=["r0", "r1", "r2"],
+                    queries=["q0", "q1"],
+                    similarity_function=DummySimilarityFunction())
+    assert str(scores) == "<Scores 3 x 2, not calculated>", "Expected different string."
+
+
+def test_scores_str_large_matrix():
+    """Test that printing large scores gives a summary instead of all scores."""
+    dummy_similarity_function = DummySimilarityFunctionParallel()
+    scores = Scores(references=[f"r{i}" for i in range(50)],
+                    queries=[f"q{i}" for i in range(50)],
+                    similarity_function=dummy_similarity_function).calculate()
+    printed_scores = str(scores)
+    assert "..." in printed_scores, "Expected summarized scores."
+    assert "r0q0" in printed_scores and "r49q49" in printed_scores, "Expected first and last scores."
+    assert "r25q25" not in printed_scores, "Expected scores in the middle to be left out."
 
 
 def test_scores_init_with_queries_dict():
@@ -138,7 +317,7 @@ def test_scores_init_with_tuple():
     scores = Scores(references=("r0", "r1", "r2"),
                     queries=("q0", "q1"),
                     similarity_function=dummy_similarity_function)
-    assert scores.scores.shape == (3, 2), "Expected different scores shape."
+    assert (scores.n_rows, scores.n_cols) == (3, 2), "Expected different scores shape."
 
 
 def test_scores_next():
@@ -160,6 +339,63 @@ def test_scores_next():
     assert actual == expected, "Expected different scores."
 
 
+def test_scores_iter_above():
+    """Test iterating over scores above a threshold."""
+    spectrum_1 = Spectrum(mz=numpy.array([100, 150, 200.]),
+                          intensities=numpy.array([0.7, 0.2, 0.1]))
+    spectrum_2 = Spectrum(mz=numpy.array([100, 140, 190.]),
+                          intensities=numpy.array([0.4, 0.2, 0.1]))
+    spectrum_3 = Spectrum(mz=numpy.array([110, 140, 195.]),
+                          intensities=numpy.array([0.6, 0.2, 0.1]))
+    spectrums = [spectrum_1, spectrum_2, spectrum_3]
+    scores = calculate_scores(spectrums, spectrums, CosineGreedy())
+
+    actual = list(scores.iter_above(0.5))
+    expected = [x for x in scores if x[2]["score"] >= 0.5]
+    assert len(actual) == 5, "Expected different number of scores."
+    assert actual == expected, "Expected different scores."
+
+
+def test_scores_iter_above_non_tuple_score():
+    """Test iterating over scores above a threshold for scores with single value."""
+    spectrum_1 = Spectrum(mz=numpy.array([100, 150, 200.]),
+                          intensities=numpy.array([0.7, 0.2, 0.1]))
+    spectrum_2 = Spectrum(mz=numpy.array([100, 140, 190.]),
+                          intensities=numpy.array([0.4, 0.2, 0.1]))
+    spectrums = [spectrum_1, spectrum_2]
+    scores = calculate_scores(spectrums, spectrums, IntersectMz())
+
+    actual = list(scores.iter_above(0.5))
+    expected = [(spectrum_1, spectrum_1, 1.0), (spectrum_2, spectrum_2, 1.0)]
+    assert actual == expected, "Expected different scores."
+
+
+def test_scores_iterate_twice():
+    """Test that iteration restarts once all scores have been returned."""
+    dummy_similarity_function = DummySimilarityFunction()
+    scores = Scores(references=["r", "rr", "rrr"],
+                    queries=["q", "qq"],
+                    similarity_function=dummy_similarity_function).calculate()
+
+    _ = next(scores)
+    assert len(list(scores)) == 5, "Expected iteration to continue with remaining scores."
+    assert len(list(scores)) == 6, "Expected iteration to restart."
+
+
+def test_scores_pickle_during_iteration():
+    """Test that scores can be pickled after iteration has started."""
+    dummy_similarity_function = DummySimilarityFunction()
+    scores = Scores(references=["r", "rr", "rrr"],
+                    queries=["q", "qq"],
+                    similarity_function=dummy_similarity_function).calculate()
+
+    _ = next(scores)
+    scores_unpickled = pickle.loads(pickle.dumps(scores))
+    assert numpy.all(scores_unpickled.scores == scores.scores), "Expected same scores."
+    assert len(list(scores_unpickled)) == 6, "Expected iteration over all scores after unpickling."
+    assert len(list(scores)) == 5, "Expected original iteration to continue."
+
+
 def test_scores_by_referencey():
     "Test scores_by_reference method."
     spectrum_1 = Spectrum(mz=numpy.array([100, 150, 200.]),
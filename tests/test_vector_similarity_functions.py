@@ -87,6 +87,19 @@ def test_cosine_similarity_matrix():
     assert scores == pytest.approx(expected_scores, 1e-7), "Expected different scores."
 
 
+def test_cosine_similarity_matrix_all_zeros_compiled():
+    """Test cosine similarity scores calculation with empty vector."""
+    vectors1 = numpy.array([[0, 0, 0, 0],
+                            [1, 0, 1, 1]])
+    vectors2 = numpy.array([[0, 1, 1, 0],
+                            [0, 0, 0, 0]])
+
+    scores = cosine_similarity_matrix(vectors1, vectors2)
+    expected_scores = numpy.array([[0., 0.],
+                                   [0.40824829, 0.]])
+    assert scores == pytest.approx(expected_scores, 1e-7), "Expected different scores."
+
+
 def test_dice_similarity_compiled():
     """Test dice similarity score calculation."""
     vector1 = numpy.array([1, 1, 0, 0])
@@ -233,3 +246,19 @@ def test_jaccard_similarity_matrix():
     expected_scores = numpy.array([[1/3, 1/4],
                                    [1/3, 2/3]])
     assert scores == pytest.approx(expected_scores, 1e-7), "Expected different scores."
+
+
+@pytest.mark.parametrize("similarity_matrix_function, similarity_function", [
+    [dice_similarity_matrix, dice_similarity],
+    [jaccard_similarity_matrix, jaccard_index]])
+def test_similarity_matrix_all_zeros_same_as_pairs(similarity_matrix_function, similarity_function):
+    """Test that matrix scores match pairwise scores, including empty vectors."""
+    vectors1 = numpy.array([[0, 0, 0, 0],
+                            [1, 0, 1, 1]])
+    vectors2 = numpy.array([[0, 1, 1, 0],
+                            [0, 0, 0, 0]])
+
+    scores = similarity_matrix_function(vectors1, vectors2)
+    expected_scores = numpy.array([[similarity_function(vector1, vector2) for vector2 in vectors2]
+                                   for vector1 in vectors1])
+    assert scores == pytest.approx(expected_scores, 1e-7), "Expected different scores."